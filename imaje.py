@@ -1,45 +1,312 @@
-import re
+import asyncio
 import socket
+import time
+from contextlib import contextmanager
 from datetime import datetime
+from functools import reduce
+from operator import xor
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _xor_checksum(buf):
+        check_sum = 0
+
+        for value in buf:
+            check_sum ^= value
+
+        return check_sum
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Fixed query commands, precomputed with their checksum byte.
+_CMD_V24_DIALOG = b"\x05"
+_CMD_PARAMETERS = b"\x20\x00\x00\x20"
+_CMD_FAULTS = b"\x3B\x00\x00\x3B"
+_CMD_RESET_FAULTS = b"\x3C\x00\x00\x3C"
+_CMD_AUTODATING_GET = b"\xD6\x00\x00\xD6"
+
+# Jet status descriptions, indexed by the raw status byte.
+_JET_STATUS = (
+    "Jet stopped",
+    "Jet in start-up phase",
+    "Jet in refresh",
+    "Jet in stability check",
+    "Jet in solvent feed",
+    "Jet in nozzle unclog",
+    "Adjustment",
+    "Jet running",
+)
+
+# Fault bit layout as (key, byte index, bit index) tuples, where the byte
+# index is relative to the 15 fault data bytes (response[4:19]): 3 printer
+# fault bytes followed by 3 bytes for each of the 4 jets.
+_FAULT_BITS = (
+    ("ink_level_low", 0, 0),
+    ("pressure_error", 0, 1),
+    ("cpu_hw_error", 0, 2),
+    ("memory_lost", 0, 3),
+    ("head_1_faulty", 0, 4),
+    ("head_2_faulty", 0, 5),
+    ("motor_cycle_fault", 0, 6),
+    ("pigmented_ink_circuit_fault", 0, 7),
+    ("autodating_fault", 1, 5),
+    ("ram_fault", 1, 6),
+    ("rom_fault", 1, 7),
+    ("v24_fault", 2, 0),
+    ("recovery_tank_too_full", 2, 1),
+    ("ink_tank_too_full", 2, 2),
+    ("accu_empty", 2, 3),
+    ("temp_fault", 2, 4),
+    ("viscosity_fault", 2, 5),
+    ("fan_fault", 2, 6),
+    ("additive_fault", 2, 7),
+) + tuple(
+    (f"j{jet_id}{suffix}", 3 + 3 * jet_id + byte_id, bit_id)
+    for jet_id in range(4)
+    for suffix, byte_id, bit_id in (
+        ("_printing_hardware_fault", 0, 0),
+        ("_frame_generator_fault", 0, 5),
+        ("_char_generator_fault", 0, 6),
+        ("_cover_fault", 1, 4),
+        ("_EHV_fault", 1, 5),
+        ("_recovery", 1, 6),
+        ("_phase_detection", 1, 7),
+        ("_not_present", 2, 0),
+        ("_communication_cpu_printer", 2, 1),
+        ("_printing_speed_fault", 2, 2),
+        ("_DTOP_filtering", 2, 3),
+        ("_no_message_to_print", 2, 4),
+        ("_incorrect_char_generator_n", 2, 5),
+        ("_DTOP_printing", 2, 6),
+    )
+)
+
+# Deletion table for bytes.translate that strips everything but ASCII digits.
+_NON_DIGITS = bytes(i for i in range(256) if i not in b"0123456789")
+
+# Expected response length per command byte, so a response split across
+# multiple TCP segments gets read completely. Commands without a data
+# response are acknowledged with a single ACK/NAK byte.
+_EXPECTED_LEN = {
+    0x05: 1,
+    0x20: 31,
+    0x30: 1,
+    0x32: 6,
+    0x33: 6,
+    0x39: 14,
+    0x3A: 1,
+    0x3B: 20,
+    0x3C: 1,
+    0x5B: 1,
+    0xC8: 1,
+    0xD6: 27,
+}
+
+
+class PrinterError(Exception):
+    """Raised when the communication with the printer fails."""
+
+
+class PrinterTimeout(PrinterError):
+    """Raised when the printer does not respond within recv_timeout."""
 
 
 class Utils(object):
     @staticmethod
-    def string_to_byte(string):
-        return (
-            string.encode()
-            .decode("unicode_escape")
-            .encode("raw_unicode_escape")
-        )
+    def extract_response_code(response: bytes) -> bool:
+        return len(response) > 0 and response[0] == 0x06
 
     @staticmethod
-    def dec_to_hex(number: int) -> str:
-        return "{:02x}".format(int(number))
+    def checksum_bytes(buf: bytes) -> int:
+        if NUMBA_AVAILABLE:
+            return int(_xor_checksum(np.frombuffer(bytes(buf), np.uint8)))
 
-    @staticmethod
-    def hex_to_text(hex_string: str) -> str:
-        return bytes.fromhex(hex_string).decode("utf-8")
+        return reduce(xor, buf, 0)
 
-    @staticmethod
-    def extract_response_code(response):
-        if isinstance(response, list):
-            return True if response[0] == "06" else False
+
+# Command builders and response parsers shared by Printer and AsyncPrinter.
+
+
+def _jet_command(command_byte: int, jet_id: int) -> bytearray:
+    command = bytearray([command_byte, 0x00, 0x01, jet_id & 0xFF])
+    command.append(Utils.checksum_bytes(command))
+
+    return command
+
+
+def _start_stop_command(mode: int) -> bytearray:
+    command = bytearray([0x30, 0x00, 0x01, mode & 0xFF])
+    command.append(Utils.checksum_bytes(command))
+
+    return command
+
+
+def _set_autodating_command(date_time: datetime) -> bytearray:
+    # The printer expects each datetime field as a BCD byte (e.g. 30
+    # seconds = 0x30), which is exactly fromhex() of the decimal digits.
+    command = bytearray([0xC8, 0x00, 0x07])
+    command += bytes.fromhex(date_time.strftime("%S%M%H%d%m%y"))
+    command.append(0x20)
+    command.append(Utils.checksum_bytes(command))
+
+    return command
+
+
+def _set_external_variable_command(jet_id: int, variables: list) -> bytearray:
+    payload = bytearray()
+
+    for variable in variables:
+        payload.append(0x12)
+        payload.extend(variable.encode())
+        payload.append(0x12)
+
+    content_length = len(payload) + 1
+
+    command = bytearray(
+        [
+            0x5B,
+            (content_length >> 8) & 0xFF,
+            content_length & 0xFF,
+            jet_id & 0xFF,
+        ]
+    )
+    command += payload
+    command.append(Utils.checksum_bytes(command))
+
+    return command
+
+
+def _parse_autodating_table(response: bytes):
+    if Utils.extract_response_code(response):
+        # The data field holds 12 ASCII digits ordered SSMMHHddmmyy,
+        # which is much cheaper to parse by slicing than via strptime.
+        digits = (
+            response[4:26].translate(None, _NON_DIGITS).decode("ascii")
+        )
+        autodating_table = datetime(
+            2000 + int(digits[10:12]),
+            int(digits[8:10]),
+            int(digits[6:8]),
+            int(digits[4:6]),
+            int(digits[2:4]),
+            int(digits[0:2]),
+        )
+        return True, autodating_table
+    else:
+        return False, None
+
+
+def _parse_jet_counter(response: bytes):
+    if Utils.extract_response_code(response):
+        counter_data = response[4:13].decode("ascii")
+        return True, int(counter_data)
+    else:
+        return False, 0
+
+
+def _parse_jet_status(response: bytes):
+    if Utils.extract_response_code(response):
+        status = response[4]
+
+        if status < len(_JET_STATUS):
+            return True, _JET_STATUS[status]
         else:
-            return False
+            return True, "Unknown"
+    else:
+        return False, None
+
+
+def _parse_jet_speed(response: bytes):
+    if Utils.extract_response_code(response):
+        # The speed byte encodes the decimal digits in BCD, e.g. 0x48
+        # means 4.8 m/s.
+        return True, float(format(response[4], "02x")) / 10
+    else:
+        return False, None
+
+
+def _parse_parameters(response: bytes):
+    if Utils.extract_response_code(response):
+        data = response[4:30].decode("ascii")
+        parameters_dict = {
+            "motor_speed": int(data[0:4]),
+            "pressure": float(data[5:9].replace(",", ".")),
+            "visco_filling_times": int(data[10:12]),
+            "additive_added": int(data[13:15]),
+            "average_jet_speed": float(data[16:20].replace(",", ".")),
+            "temperature_of_electronics": int(data[21:23]),
+            "temperature_of_ink_circuit": int(data[24:26]),
+        }
+
+        return True, parameters_dict
+    else:
+        return False, None
+
+
+def _parse_printer_faults(response: bytes):
+    if Utils.extract_response_code(response):
+        if NUMPY_AVAILABLE:
+            # Expand all fault bits in one vectorized call and pick them
+            # out via the precomputed layout table.
+            fault_bytes = np.frombuffer(response[4:19], dtype=np.uint8)
+            bits = np.unpackbits(
+                fault_bytes, bitorder="little"
+            ).reshape(-1, 8)
+
+            faults_dict = {
+                key: bool(bits[byte_id, bit_id])
+                for key, byte_id, bit_id in _FAULT_BITS
+            }
+
+            return True, faults_dict
+
+        # Read the error bits straight out of the response bytes with
+        # integer masks, reusing the precomputed layout table and its
+        # prebuilt key strings.
+        fault_bytes = response[4:19]
+
+        faults_dict = {
+            key: (fault_bytes[byte_id] & (1 << bit_id)) != 0
+            for key, byte_id, bit_id in _FAULT_BITS
+        }
+
+        return True, faults_dict
+    else:
+        return False, None
 
-    @staticmethod
-    def calculate_checksum(command) -> str:
-        hex_array = command.split(r"\x")[1:]
-        check_sum_dec = 0
 
-        for hex_num in hex_array:
-            check_sum_dec = int(check_sum_dec) ^ int(f"0x{hex_num}", 16)
+def _count_available_jets(printer_faults):
+    count = 0
 
-        return f"{command}\\x{Utils.dec_to_hex(check_sum_dec)}"
+    if printer_faults[0]:
+        for key, value in printer_faults[1].items():
+            if "not_present" in key:
+                if int(value) == 0:
+                    count += 1
+
+        return True, count
+    else:
+        return False, None
 
 
 class Printer(object):
-    def __init__(self, printer_ip: str, printer_port: int = 2101) -> None:
+    def __init__(
+        self,
+        printer_ip: str,
+        printer_port: int = 2101,
+        recv_timeout: float = 2.0,
+    ) -> None:
         """
         Constructs all the necessary attributes for the printer object.
 
@@ -49,22 +316,159 @@ class Printer(object):
                 The IP-Address of the Printer
             printer_port : int, optional
                 The Network Port of the Printer (by default 2101)
+            recv_timeout : float, optional
+                How many seconds to wait for a response before giving up
+                (by default 2.0)
         """
 
         self.ip: str = printer_ip
         self.port: int = printer_port
+        self.recv_timeout: float = recv_timeout
+        self.idle_timeout: float = 30.0
+
+        self._sock = None
+        self._last_used: float = 0.0
+
+        self._jet_count_cache = None
+        self._jet_cache_ttl: float = 2.0
+        self._in_pipeline: bool = False
+
+    @contextmanager
+    def pipeline(self):
+        """
+        Context manager for sending many commands back to back. For the
+        duration of the block the jet count used for validation is only
+        fetched once, no matter how long the block runs:
+
+            with printer.pipeline():
+                for jet_id in range(1, 5):
+                    printer.reset_jet_counter(jet_id)
+        """
+
+        self._in_pipeline = True
 
-    def send_command(self, command):
         try:
-            print_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            print_socket.connect((self.ip, self.port))
-            print_socket.send(Utils.string_to_byte(command))
-            response = print_socket.recv(1024)
-            print_socket.close()
+            yield self
+        finally:
+            self._in_pipeline = False
+
+    def _get_socket(self):
+        # Reconnect proactively if the connection sat idle for too long, as
+        # the printer may have dropped it silently in the meantime.
+        if (
+            self._sock is not None
+            and time.monotonic() - self._last_used > self.idle_timeout
+        ):
+            self.close()
+
+        if self._sock is None:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._sock.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+            )
+            self._sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1
+            )
+            self._sock.settimeout(self.recv_timeout)
+            self._sock.connect((self.ip, self.port))
 
-            return [format(x, "02x") for x in response]
-        except Exception as e:
-            return e
+        return self._sock
+
+    def close(self) -> None:
+        """
+        Close the connection to the printer. It gets reopened automatically
+        by the next command.
+        """
+
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _recv_response(self, print_socket, command: bytes) -> bytes:
+        response = print_socket.recv(1024)
+
+        # An empty read means the printer closed the pooled connection, so
+        # the command never ran. Raise so send_command reconnects and
+        # retries instead of handing an empty response to the parsers.
+        if not response:
+            raise ConnectionResetError("Connection closed by printer")
+
+        expected = _EXPECTED_LEN.get(command[0])
+
+        # Keep reading until the frame is complete in case the printer
+        # fragments the response across TCP segments. NAK responses are a
+        # single byte, so only ACK frames are topped up.
+        if expected is not None and response[:1] == b"\x06":
+            while len(response) < expected:
+                chunk = print_socket.recv(expected - len(response))
+
+                if not chunk:
+                    raise ConnectionResetError(
+                        "Connection closed by printer mid-frame"
+                    )
+
+                response += chunk
+
+        return response
+
+    def send_command(self, command: bytes) -> bytes:
+        try:
+            try:
+                print_socket = self._get_socket()
+                print_socket.sendall(command)
+                response = self._recv_response(print_socket, command)
+            except (ConnectionResetError, BrokenPipeError):
+                # The printer closed the pooled connection, reconnect once
+                # and retry the command on a fresh socket.
+                self.close()
+                print_socket = self._get_socket()
+                print_socket.sendall(command)
+                response = self._recv_response(print_socket, command)
+        except socket.timeout as e:
+            self.close()
+            raise PrinterTimeout(
+                f"No response from {self.ip}:{self.port} within "
+                f"{self.recv_timeout} seconds"
+            ) from e
+        except OSError as e:
+            self.close()
+            raise PrinterError(
+                f"Communication with {self.ip}:{self.port} failed: {e}"
+            ) from e
+
+        self._last_used = time.monotonic()
+
+        return response
+
+    def _validate_jet(self, jet_id: int, action: str) -> None:
+        # Memoize the jet count briefly so loops of jet-addressed commands
+        # pay the validation round-trip only once. Inside a pipeline block
+        # the cached count is kept for the whole block.
+        if self._jet_count_cache is None or (
+            not self._in_pipeline
+            and time.monotonic() - self._jet_count_cache[0]
+            > self._jet_cache_ttl
+        ):
+            return_code, jet_count = self.get_number_of_available_jets()
+
+            if return_code:
+                self._jet_count_cache = (time.monotonic(), jet_count)
+            else:
+                return
+
+        if jet_id > self._jet_count_cache[1]:
+            print(
+                f"Attention, it seems that you are trying to {action} a "
+                "non-existent jet. This can lead to unpredictable problems."
+            )
 
     def get_v24_dialog(self) -> bool:
         """
@@ -85,7 +489,9 @@ class Printer(object):
             False = not ready to dialog
         """
 
-        return Utils.extract_response_code(self.send_command("\\x05"))
+        return Utils.extract_response_code(
+            self.send_command(_CMD_V24_DIALOG)
+        )
 
     def start_stop_printer(self, mode: int) -> bool:
         """
@@ -110,12 +516,10 @@ class Printer(object):
             False = failure
         """
 
+        self._jet_count_cache = None
+
         return Utils.extract_response_code(
-            self.send_command(
-                Utils.calculate_checksum(
-                    f"\\x30\\x00\\x01\\x{Utils.dec_to_hex(mode)}"
-                )
-            )
+            self.send_command(_start_stop_command(mode))
         )
 
     def get_autodating_table(self) -> list:
@@ -138,15 +542,7 @@ class Printer(object):
             Returns the currently stored Date & time as Datetime string
         """
 
-        response = self.send_command("\\xD6\\x00\\x00\\xD6")
-
-        if Utils.extract_response_code(response):
-            data = Utils.hex_to_text("".join(response[4:26]))
-            date_string = re.sub(r"[^0-9]", "", data)
-            autodating_table = datetime.strptime(date_string, "%S%M%H%d%m%y")
-            return True, autodating_table
-        else:
-            return False, None
+        return _parse_autodating_table(self.send_command(_CMD_AUTODATING_GET))
 
     def set_autodating_table(self, date_time: datetime) -> int:
         """
@@ -166,16 +562,8 @@ class Printer(object):
             False = failure
         """
 
-        date_time_format = "\\x%S\\x%M\\x%H\\x%d\\x%m\\x%y"
-
         return Utils.extract_response_code(
-            self.send_command(
-                Utils.calculate_checksum(
-                    "\\xC8\\x00\\x07"
-                    f"{date_time.strftime(date_time_format)}"
-                    "\\x20"
-                )
-            )
+            self.send_command(_set_autodating_command(date_time))
         )
 
     def set_external_variable(self, jet_id: int, variables: list) -> int:
@@ -201,31 +589,11 @@ class Printer(object):
             False = failure
         """
 
-        if jet_id > self.get_number_of_available_jets()[1]:
-            print(
-                "Attention, it seems that you are trying to set the external "
-                "variables from a non-existent jet! This can lead to dramatic "
-                "problems!"
-            )
-
-        variables_hex = ""
-        content_length = 1
-
-        for variable in variables:
-            content_length = content_length + len(variable) + 2
-            variable_hex = "".join([f"\\x{ord(c):02x}" for c in variable])
-            variables_hex += f"\\x12{variable_hex}\\x12"
-
-        content_length = "{:04x}".format(content_length)
+        self._validate_jet(jet_id, "set the external variables of")
 
         return Utils.extract_response_code(
             self.send_command(
-                Utils.calculate_checksum(
-                    f"\\x5B"
-                    f"\\x{content_length[:2]}\\x{content_length[2:]}"
-                    f"\\x{Utils.dec_to_hex(jet_id)}"
-                    f"{variables_hex}"
-                )
+                _set_external_variable_command(jet_id, variables)
             )
         )
 
@@ -252,25 +620,12 @@ class Printer(object):
             Returns the counter for the respective printhead
         """
 
-        if jet_id > self.get_number_of_available_jets()[1]:
-            print(
-                "Attention, it seems that you are trying to get the jet "
-                "counter of a non-existent jet. This can lead to "
-                "unpredictable problems."
-            )
+        self._validate_jet(jet_id, "get the jet counter of")
 
-        response = self.send_command(
-            Utils.calculate_checksum(
-                f"\\x39\\x00\\x01\\x{Utils.dec_to_hex(jet_id)}"
-            )
+        return _parse_jet_counter(
+            self.send_command(_jet_command(0x39, jet_id))
         )
 
-        if Utils.extract_response_code(response):
-            counter_data = Utils.hex_to_text("".join(response[4:13]))
-            return True, int(counter_data)
-        else:
-            return False, 0
-
     def reset_jet_counter(self, jet_id: int) -> int:
         """
         Reset current counters
@@ -290,19 +645,10 @@ class Printer(object):
             False = failure
         """
 
-        if jet_id > self.get_number_of_available_jets()[1]:
-            print(
-                "Attention, it seems that you are trying to reset the jet "
-                "counter of a non-existent jet. This can lead to "
-                "unpredictable problems."
-            )
+        self._validate_jet(jet_id, "reset the jet counter of")
 
         return Utils.extract_response_code(
-            self.send_command(
-                Utils.calculate_checksum(
-                    f"\\x3A\\x00\\x01\\x{Utils.dec_to_hex(jet_id)}"
-                )
-            )
+            self.send_command(_jet_command(0x3A, jet_id))
         )
 
     def get_jet_status(self, jet_id: int) -> list:
@@ -327,34 +673,12 @@ class Printer(object):
             Returns the status of the jet
         """
 
-        if jet_id > self.get_number_of_available_jets()[1]:
-            print(
-                "Attention, it seems that you are trying to get the status of "
-                "a non-existent jet. This can lead to unpredictable problems."
-            )
+        self._validate_jet(jet_id, "get the status of")
 
-        available_status = {
-            "00": "Jet stopped",
-            "01": "Jet in start-up phase",
-            "02": "Jet in refresh",
-            "03": "Jet in stability check",
-            "04": "Jet in solvent feed",
-            "05": "Jet in nozzle unclog",
-            "06": "Adjustment",
-            "07": "Jet running",
-        }
-
-        response = self.send_command(
-            Utils.calculate_checksum(
-                f"\\x32\\x00\\x01\\x{Utils.dec_to_hex(jet_id)}"
-            )
+        return _parse_jet_status(
+            self.send_command(_jet_command(0x32, jet_id))
         )
 
-        if Utils.extract_response_code(response):
-            return True, available_status[response[4]]
-        else:
-            return False, None
-
     def get_jet_speed(self, jet_id: int) -> list:
         """
         Request jet speed and phase
@@ -377,17 +701,10 @@ class Printer(object):
             Returns the jet speed of the jet in m/s
         """
 
-        response = self.send_command(
-            Utils.calculate_checksum(
-                f"\\x33\\x00\\x01\\x{Utils.dec_to_hex(jet_id)}"
-            )
+        return _parse_jet_speed(
+            self.send_command(_jet_command(0x33, jet_id))
         )
 
-        if Utils.extract_response_code(response):
-            return True, float(response[4]) / 10
-        else:
-            return False, None
-
     def get_number_of_available_jets(self) -> list:
         """
         Get the number the jets currently available
@@ -408,18 +725,7 @@ class Printer(object):
             Returns the number of jets. Normally a number between 1-4
         """
 
-        count = 0
-        printer_faults = self.get_printer_faults()
-
-        if printer_faults[0]:
-            for key, value in printer_faults[1].items():
-                if "not_present" in key:
-                    if int(value) == 0:
-                        count += 1
-
-            return True, count
-        else:
-            return False, None
+        return _count_available_jets(self.get_printer_faults())
 
     def get_parameters(self) -> list:
         """
@@ -441,23 +747,7 @@ class Printer(object):
             Returns the parameters
         """
 
-        response = self.send_command("\\x20\\x00\\x00\\x20")
-
-        if Utils.extract_response_code(response):
-            data = Utils.hex_to_text("".join(response[4:30]))
-            parameters_dict = {
-                "motor_speed": int(data[0:4]),
-                "pressure": float(data[5:9].replace(",", ".")),
-                "visco_filling_times": int(data[10:12]),
-                "additive_added": int(data[13:15]),
-                "average_jet_speed": float(data[16:20].replace(",", ".")),
-                "temperature_of_electronics": int(data[21:23]),
-                "temperature_of_ink_circuit": int(data[24:26]),
-            }
-
-            return True, parameters_dict
-        else:
-            return False, None
+        return _parse_parameters(self.send_command(_CMD_PARAMETERS))
 
     def get_printer_faults(self) -> list:
         """
@@ -479,66 +769,7 @@ class Printer(object):
             Returns the faults
         """
 
-        response = self.send_command("\\x3B\\x00\\x00\\x3B")
-
-        if Utils.extract_response_code(response):
-            # Convert the hex numbers to binary so that the error bits can be
-            # read out afterwards.
-            response_bin = [bin(int(i, 16))[2:].zfill(8) for i in response]
-
-            printer_faults = response_bin[4:7]
-            jet_faults = [
-                response_bin[7:10],
-                response_bin[10:13],
-                response_bin[13:16],
-                response_bin[16:19],
-            ]
-
-            faults_dict = {
-                "ink_level_low": printer_faults[0][7],
-                "pressure_error": printer_faults[0][6],
-                "cpu_hw_error": printer_faults[0][5],
-                "memory_lost": printer_faults[0][4],
-                "head_1_faulty": printer_faults[0][3],
-                "head_2_faulty": printer_faults[0][2],
-                "motor_cycle_fault": printer_faults[0][1],
-                "pigmented_ink_circuit_fault": printer_faults[0][0],
-                "autodating_fault": printer_faults[1][2],
-                "ram_fault": printer_faults[1][1],
-                "rom_fault": printer_faults[1][0],
-                "v24_fault": printer_faults[2][7],
-                "recovery_tank_too_full": printer_faults[2][6],
-                "ink_tank_too_full": printer_faults[2][5],
-                "accu_empty": printer_faults[2][4],
-                "temp_fault": printer_faults[2][3],
-                "viscosity_fault": printer_faults[2][2],
-                "fan_fault": printer_faults[2][1],
-                "additive_fault": printer_faults[2][0],
-            }
-
-            for jet_id, faults in enumerate(jet_faults):
-                faults_dict.update(
-                    {
-                        f"j{jet_id}_printing_hardware_fault": faults[0][7],
-                        f"j{jet_id}_frame_generator_fault": faults[0][2],
-                        f"j{jet_id}_char_generator_fault": faults[0][1],
-                        f"j{jet_id}_cover_fault": faults[1][3],
-                        f"j{jet_id}_EHV_fault": faults[1][2],
-                        f"j{jet_id}_recovery": faults[1][1],
-                        f"j{jet_id}_phase_detection": faults[1][0],
-                        f"j{jet_id}_not_present": faults[2][7],
-                        f"j{jet_id}_communication_cpu_printer": faults[2][6],
-                        f"j{jet_id}_printing_speed_fault": faults[2][5],
-                        f"j{jet_id}_DTOP_filtering": faults[2][4],
-                        f"j{jet_id}_no_message_to_print": faults[2][3],
-                        f"j{jet_id}_incorrect_char_generator_n": faults[2][2],
-                        f"j{jet_id}_DTOP_printing": faults[2][1],
-                    }
-                )
-
-            return True, faults_dict
-        else:
-            return False, None
+        return _parse_printer_faults(self.send_command(_CMD_FAULTS))
 
     def reset_printer_faults(self) -> int:
         """
@@ -557,6 +788,280 @@ class Printer(object):
             False = failure
         """
 
+        self._jet_count_cache = None
+
+        return Utils.extract_response_code(
+            self.send_command(_CMD_RESET_FAULTS)
+        )
+
+
+class AsyncPrinter(object):
+    """
+    Asynchronous counterpart of Printer. It offers the same methods as
+    coroutines on top of a persistent asyncio connection, so commands to
+    several printers can be overlapped with asyncio.gather instead of
+    waiting one round-trip per printer. See the Printer methods for the
+    parameter and return value documentation.
+    """
+
+    def __init__(
+        self,
+        printer_ip: str,
+        printer_port: int = 2101,
+        recv_timeout: float = 2.0,
+    ) -> None:
+        """
+        Constructs all the necessary attributes for the printer object.
+
+        Parameters
+        ----------
+            printer_ip : str
+                The IP-Address of the Printer
+            printer_port : int, optional
+                The Network Port of the Printer (by default 2101)
+            recv_timeout : float, optional
+                How many seconds to wait for a response before giving up
+                (by default 2.0)
+        """
+
+        self.ip: str = printer_ip
+        self.port: int = printer_port
+        self.recv_timeout: float = recv_timeout
+        self.idle_timeout: float = 30.0
+
+        self._reader = None
+        self._writer = None
+        self._last_used: float = 0.0
+
+        self._jet_count_cache = None
+        self._jet_cache_ttl: float = 2.0
+
+    async def _get_connection(self):
+        # Reconnect proactively if the connection sat idle for too long, as
+        # the printer may have dropped it silently in the meantime.
+        if (
+            self._writer is not None
+            and time.monotonic() - self._last_used > self.idle_timeout
+        ):
+            await self.close()
+
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.ip, self.port
+            )
+
+            sock = self._writer.get_extra_info("socket")
+
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        return self._reader, self._writer
+
+    async def close(self) -> None:
+        """
+        Close the connection to the printer. It gets reopened automatically
+        by the next command.
+        """
+
+        if self._writer is not None:
+            try:
+                self._writer.close()
+
+                try:
+                    await self._writer.wait_closed()
+                except OSError:
+                    pass
+            finally:
+                self._reader = None
+                self._writer = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _exchange(self, command: bytes) -> bytes:
+        reader, writer = await self._get_connection()
+        writer.write(command)
+        await writer.drain()
+
+        response = await reader.read(1024)
+
+        # An empty read means the printer closed the pooled connection, so
+        # the command never ran. Raise so send_command reconnects and
+        # retries instead of handing an empty response to the parsers.
+        if not response:
+            raise ConnectionResetError("Connection closed by printer")
+
+        expected = _EXPECTED_LEN.get(command[0])
+
+        # Keep reading until the frame is complete in case the printer
+        # fragments the response across TCP segments. NAK responses are a
+        # single byte, so only ACK frames are topped up.
+        if expected is not None and response[:1] == b"\x06":
+            while len(response) < expected:
+                chunk = await reader.read(expected - len(response))
+
+                if not chunk:
+                    raise ConnectionResetError(
+                        "Connection closed by printer mid-frame"
+                    )
+
+                response += chunk
+
+        return response
+
+    async def send_command(self, command: bytes) -> bytes:
+        try:
+            try:
+                response = await asyncio.wait_for(
+                    self._exchange(command), self.recv_timeout
+                )
+            except (ConnectionResetError, BrokenPipeError):
+                # The printer closed the pooled connection, reconnect once
+                # and retry the command on a fresh socket.
+                await self.close()
+                response = await asyncio.wait_for(
+                    self._exchange(command), self.recv_timeout
+                )
+        except asyncio.TimeoutError as e:
+            await self.close()
+            raise PrinterTimeout(
+                f"No response from {self.ip}:{self.port} within "
+                f"{self.recv_timeout} seconds"
+            ) from e
+        except OSError as e:
+            await self.close()
+            raise PrinterError(
+                f"Communication with {self.ip}:{self.port} failed: {e}"
+            ) from e
+
+        self._last_used = time.monotonic()
+
+        return response
+
+    async def _validate_jet(self, jet_id: int, action: str) -> None:
+        # Memoize the jet count briefly so loops of jet-addressed commands
+        # pay the validation round-trip only once.
+        if (
+            self._jet_count_cache is None
+            or time.monotonic() - self._jet_count_cache[0]
+            > self._jet_cache_ttl
+        ):
+            return_code, jet_count = (
+                await self.get_number_of_available_jets()
+            )
+
+            if return_code:
+                self._jet_count_cache = (time.monotonic(), jet_count)
+            else:
+                return
+
+        if jet_id > self._jet_count_cache[1]:
+            print(
+                f"Attention, it seems that you are trying to {action} a "
+                "non-existent jet. This can lead to unpredictable problems."
+            )
+
+    async def get_v24_dialog(self) -> bool:
+        """Async variant of Printer.get_v24_dialog"""
+
+        return Utils.extract_response_code(
+            await self.send_command(_CMD_V24_DIALOG)
+        )
+
+    async def start_stop_printer(self, mode: int) -> bool:
+        """Async variant of Printer.start_stop_printer"""
+
+        self._jet_count_cache = None
+
+        return Utils.extract_response_code(
+            await self.send_command(_start_stop_command(mode))
+        )
+
+    async def get_autodating_table(self) -> list:
+        """Async variant of Printer.get_autodating_table"""
+
+        return _parse_autodating_table(
+            await self.send_command(_CMD_AUTODATING_GET)
+        )
+
+    async def set_autodating_table(self, date_time: datetime) -> int:
+        """Async variant of Printer.set_autodating_table"""
+
+        return Utils.extract_response_code(
+            await self.send_command(_set_autodating_command(date_time))
+        )
+
+    async def set_external_variable(
+        self, jet_id: int, variables: list
+    ) -> int:
+        """Async variant of Printer.set_external_variable"""
+
+        await self._validate_jet(jet_id, "set the external variables of")
+
+        return Utils.extract_response_code(
+            await self.send_command(
+                _set_external_variable_command(jet_id, variables)
+            )
+        )
+
+    async def get_jet_counter(self, jet_id: int = 1) -> list:
+        """Async variant of Printer.get_jet_counter"""
+
+        await self._validate_jet(jet_id, "get the jet counter of")
+
+        return _parse_jet_counter(
+            await self.send_command(_jet_command(0x39, jet_id))
+        )
+
+    async def reset_jet_counter(self, jet_id: int) -> int:
+        """Async variant of Printer.reset_jet_counter"""
+
+        await self._validate_jet(jet_id, "reset the jet counter of")
+
+        return Utils.extract_response_code(
+            await self.send_command(_jet_command(0x3A, jet_id))
+        )
+
+    async def get_jet_status(self, jet_id: int) -> list:
+        """Async variant of Printer.get_jet_status"""
+
+        await self._validate_jet(jet_id, "get the status of")
+
+        return _parse_jet_status(
+            await self.send_command(_jet_command(0x32, jet_id))
+        )
+
+    async def get_jet_speed(self, jet_id: int) -> list:
+        """Async variant of Printer.get_jet_speed"""
+
+        return _parse_jet_speed(
+            await self.send_command(_jet_command(0x33, jet_id))
+        )
+
+    async def get_number_of_available_jets(self) -> list:
+        """Async variant of Printer.get_number_of_available_jets"""
+
+        return _count_available_jets(await self.get_printer_faults())
+
+    async def get_parameters(self) -> list:
+        """Async variant of Printer.get_parameters"""
+
+        return _parse_parameters(await self.send_command(_CMD_PARAMETERS))
+
+    async def get_printer_faults(self) -> list:
+        """Async variant of Printer.get_printer_faults"""
+
+        return _parse_printer_faults(await self.send_command(_CMD_FAULTS))
+
+    async def reset_printer_faults(self) -> int:
+        """Async variant of Printer.reset_printer_faults"""
+
+        self._jet_count_cache = None
+
         return Utils.extract_response_code(
-            self.send_command("\\x3C\\x00\\x00\\x3C")
+            await self.send_command(_CMD_RESET_FAULTS)
         )